@@ -1,3 +1,19 @@
-# Кастомный класс исключения вынесен в отдельный файл
+# Кастомные классы исключений вынесены в отдельный файл
 class APIResponseError(Exception):
     """Исключение для ошибок ответа API."""
+
+
+class RateLimitError(APIResponseError):
+    """Исключение для ответа API с кодом 429 (слишком много запросов)."""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """Исключение для запроса, отклонённого разомкнутым автоматом."""
+
+    def __init__(self, message, remaining):
+        super().__init__(message)
+        self.remaining = remaining
@@ -1,15 +1,22 @@
 import os
+import random
 import sys
 import time
 import logging
+import math
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
 from http import HTTPStatus
 
+import orjson
 import requests
 import telebot
 from dotenv import load_dotenv
 
 
-from exceptions import APIResponseError
+from exceptions import APIResponseError, CircuitOpenError, RateLimitError
 
 # Загрузка переменных окружения
 load_dotenv()
@@ -19,18 +26,116 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
+# Таймауты (подключение, чтение) запроса к API, сек.
+REQUEST_TIMEOUT = (5, 30)
+# Параметры экспоненциальной задержки при сбоях запроса к API
+BACKOFF_BASE = 1.0
+BACKOFF_MAX_DELAY = 30
+BACKOFF_JITTER = 0.5
+BACKOFF_MAX_EXPONENT = 16
+# Для скольких работ помнить последний отправленный статус
+MAX_DEDUP = 1000
+# Сколько неотправленных сообщений хранить в очереди
+OUTBOX_SIZE = 64
+# Число сбоев API подряд, после которого запросы временно прекращаются,
+# и длительность паузы (сек.) для первого, второго и последующих раз
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWNS = (60, 300, 900)
+# Таймауты (подключение, чтение) запросов к Telegram, сек.,
+# и число попыток отправки при сетевых сбоях
+TELEGRAM_TIMEOUT = (5, 15)
+TELEGRAM_MAX_RETRIES = 3
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
+# Валидаторы кэша из последнего успешного ответа API
+# для условных запросов (If-None-Match / If-Modified-Since)
+_cache_validators = {}
+
+REQUIRED_HW_KEYS = frozenset(('homework_name', 'status'))
+
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+STATUS_TEMPLATE = 'Изменился статус проверки работы "{name}". {verdict}'
+# Готовые функции форматирования сообщения для каждого статуса
+_VERDICT_FORMATTERS = {
+    status: partial(STATUS_TEMPLATE.format, verdict=verdict)
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
+
+class CircuitBreaker:
+    """Автоматический выключатель запросов к API.
+
+    После CIRCUIT_BREAKER_THRESHOLD сбоев подряд размыкается и отклоняет
+    запросы, пока не истечёт пауза. Затем пропускает один пробный запрос:
+    успех замыкает выключатель, сбой снова размыкает его на более долгий
+    срок.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+            self,
+            threshold=CIRCUIT_BREAKER_THRESHOLD,
+            cooldowns=CIRCUIT_BREAKER_COOLDOWNS
+    ):
+        """Создаёт замкнутый выключатель."""
+        self.threshold = threshold
+        self.cooldowns = cooldowns
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at = None
+
+    @property
+    def cooldown(self):
+        """Длительность текущей паузы в секундах."""
+        return self.cooldowns[min(self.trips, len(self.cooldowns)) - 1]
+
+    def call(self, func, *args):
+        """Вызывает функцию, если выключатель это допускает."""
+        if self.state == self.OPEN:
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f'Запросы к API приостановлены ещё на {int(remaining)} '
+                    'сек. после серии сбоев',
+                    remaining
+                )
+            self.state = self.HALF_OPEN
+
+        try:
+            result = func(*args)
+        except (ConnectionError, APIResponseError):
+            self._record_failure()
+            raise
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        return result
+
+    def _record_failure(self):
+        """Учитывает сбой и при необходимости размыкает выключатель."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.trips += 1
+            self.opened_at = time.monotonic()
+            logging.warning(
+                'Запросы к API приостановлены на %s сек.', self.cooldown)
 
 
 def check_tokens():
     """Проверяет доступность переменных окружения."""
+    global TELEGRAM_CHAT_ID
+
     missing_tokens = []
     tokens = (
         ('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
@@ -42,41 +147,65 @@ def check_tokens():
             missing_tokens.append(token_name)
 
     if missing_tokens:
-        logging.critical(
-            f'Отсутствуют обязательные переменные окружения: {
-                ", ".join(missing_tokens)}'
-        )
-        raise ValueError(
-            f'Отсутствуют обязательные переменные окружения: {
-                ", ".join(missing_tokens)}'
+        error_message = (
+            'Отсутствуют обязательные переменные окружения: '
+            + ', '.join(missing_tokens)
         )
+        logging.critical(error_message)
+        raise ValueError(error_message)
+
+    try:
+        TELEGRAM_CHAT_ID = int(TELEGRAM_CHAT_ID)
+    except ValueError:
+        error_message = (
+            f'TELEGRAM_CHAT_ID должен быть целым числом: {TELEGRAM_CHAT_ID}')
+        logging.critical(error_message)
+        raise ValueError(error_message)
 
 
 def send_message(bot, message):
     """Отправляет сообщение в Telegram чат."""
-    logging.debug(f'Начало отправки сообщения: "{message}"')
+    logging.debug('Начало отправки сообщения: "%s"', message)
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
-        logging.debug(f'Бот отправил сообщение "{message}"')
+        logging.debug('Бот отправил сообщение "%s"', message)
     except (
             telebot.apihelper.ApiException, requests.RequestException
     ) as error:
-        logging.exception(f'Ошибка при отправке сообщения в Telegram: {error}')
+        logging.exception(
+            'Ошибка при отправке сообщения в Telegram: %s', error)
         raise
 
 
 def get_api_answer(timestamp):
     """Делает запрос к эндпоинту API-сервиса."""
-    logging.debug(f'Отправка запроса к {ENDPOINT} с timestamp: {timestamp}')
+    logging.debug('Отправка запроса к %s с timestamp: %s', ENDPOINT, timestamp)
     try:
         response = requests.get(
             ENDPOINT,
-            headers=HEADERS,
-            params={'from_date': timestamp}
+            headers={**HEADERS, **_cache_validators},
+            params={'from_date': timestamp},
+            timeout=REQUEST_TIMEOUT
         )
+    except requests.exceptions.Timeout as error:
+        raise ConnectionError(f'Превышено время ожидания ответа API: {error}')
     except requests.exceptions.RequestException as error:
         raise ConnectionError(f'Ошибка при запросе к API: {error}')
 
+    if response.status_code == HTTPStatus.NOT_MODIFIED and _cache_validators:
+        logging.debug('Ответ API не изменился с предыдущего запроса')
+        return {'homeworks': [], 'current_date': timestamp}
+
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+        # Задержка меняется от запроса к запросу, поэтому пишется только
+        # в лог: текст исключения уходит в Telegram и должен быть постоянным
+        logging.warning(
+            'Превышен лимит запросов к API, повторный запрос через %s сек.',
+            retry_after)
+        raise RateLimitError(
+            f'Превышен лимит запросов к {ENDPOINT}', retry_after)
+
     if response.status_code != HTTPStatus.OK:
         raise APIResponseError(
             f'Эндпоинт {ENDPOINT} недоступен. Код ответа API: {
@@ -84,26 +213,57 @@ def get_api_answer(timestamp):
         )
 
     try:
-        api_response = response.json()
-        logging.debug(f'Успешно получен ответ от API: {api_response}')
-        return api_response
-    except ValueError as error:
+        api_response = orjson.loads(response.content)
+    except orjson.JSONDecodeError as error:
         raise ValueError(f'Ошибка преобразования в JSON: {error}')
 
+    _update_cache_validators(response.headers)
+    # Ответ API может быть большим: не форматируем его без нужды
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug('Успешно получен ответ от API: %s', api_response)
+    return api_response
+
+
+def _update_cache_validators(headers):
+    """Запоминает ETag и Last-Modified для следующего запроса."""
+    _cache_validators.clear()
+    if headers.get('ETag'):
+        _cache_validators['If-None-Match'] = headers['ETag']
+    if headers.get('Last-Modified'):
+        _cache_validators['If-Modified-Since'] = headers['Last-Modified']
+
+
+def _parse_retry_after(value):
+    """Преобразует заголовок Retry-After в задержку в секундах."""
+    if value is None:
+        return RETRY_PERIOD
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return RETRY_PERIOD
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return max(0, int(delay))
+
 
 def check_response(response):
     """Проверяет ответ API на соответствие документации."""
     logging.debug('Начало проверки ответа API')
 
-    if not isinstance(response, dict):
+    try:
+        homeworks = response['homeworks']
+    except TypeError:
         raise TypeError(
             f'Ответ API не является словарем. Получен тип: {type(response)}')
-
-    if 'homeworks' not in response:
+    except KeyError:
         raise KeyError('В ответе API отсутствует ключ homeworks')
 
-    homeworks = response['homeworks']
-    if not isinstance(homeworks, list):
+    if type(homeworks) is not list:
         raise TypeError(
             f'homeworks не является списком. Получен тип: {type(homeworks)}')
 
@@ -115,24 +275,23 @@ def parse_status(homework):
     """Извлекает статус домашней работы."""
     logging.debug('Начало извлечения статуса домашней работы')
 
-    required_keys = ['homework_name', 'status']
-    missing_keys = [key for key in required_keys if key not in homework]
-
+    missing_keys = REQUIRED_HW_KEYS - homework.keys()
     if missing_keys:
         raise KeyError(
-            f'В ответе API отсутствуют ключи: {", ".join(missing_keys)}')
+            f'В ответе API отсутствуют ключи: {
+                ", ".join(sorted(missing_keys))}')
 
     homework_name = homework['homework_name']
     status = homework['status']
 
-    if status not in HOMEWORK_VERDICTS:
+    try:
+        format_message = _VERDICT_FORMATTERS[status]
+    except KeyError:
         raise ValueError(f'Неизвестный статус домашней работы: {status}')
 
-    verdict = HOMEWORK_VERDICTS[status]
-    result_message = f'Изменился статус проверки работы "{
-        homework_name}". {verdict}'
+    result_message = format_message(name=homework_name)
 
-    logging.debug(f'Статус успешно извлечен: {result_message}')
+    logging.debug('Статус успешно извлечен: %s', result_message)
     return result_message
 
 
@@ -144,38 +303,158 @@ def main():
         sys.exit(f'Ошибка инициализации: {error}')
 
     last_sent_message = None
+    last_status = OrderedDict()
+    outbox = deque(maxlen=OUTBOX_SIZE)
+    breaker = CircuitBreaker()
+    consecutive_errors = 0
+    _configure_telegram_api()
     bot = telebot.TeleBot(TELEGRAM_TOKEN)
     timestamp = int(time.time())
 
     logging.info('Бот запущен')
 
+    next_poll = time.monotonic()
     while True:
         try:
-            timestamp, last_sent_message = _process_homeworks(
-                bot, timestamp, last_sent_message)
+            timestamp = _process_homeworks(
+                timestamp, outbox, last_status, breaker)
+            consecutive_errors = 0
+            next_poll = _next_regular_poll(next_poll)
+        except CircuitOpenError as error:
+            logging.warning(error)
+            next_poll = time.monotonic() + error.remaining
+        except RateLimitError as error:
+            last_sent_message = _handle_error(bot, error, last_sent_message)
+            next_poll = time.monotonic() + error.retry_after
+        except (ConnectionError, APIResponseError) as error:
+            last_sent_message = _handle_error(bot, error, last_sent_message)
+            consecutive_errors += 1
+            next_poll = (
+                time.monotonic() + _get_backoff_delay(consecutive_errors))
         except Exception as error:
             last_sent_message = _handle_error(bot, error, last_sent_message)
-        finally:
-            time.sleep(RETRY_PERIOD)
+            next_poll = _next_regular_poll(next_poll)
+        # Отправка не зависит от того, ответил ли API на этой итерации
+        last_sent_message = _deliver_outbox(bot, outbox, last_sent_message)
+        delay = _seconds_until(next_poll)
+        time.sleep(delay)
+
+
+def _configure_telegram_api():
+    """Настраивает соединение pyTelegramBotAPI с Telegram.
+
+    Сессия requests переиспользуется без ограничения срока жизни,
+    а запросы прерываются по таймауту и повторяются при сетевых сбоях.
+    """
+    apihelper = telebot.apihelper
+    apihelper.SESSION_TIME_TO_LIVE = None
+    apihelper.CONNECT_TIMEOUT, apihelper.READ_TIMEOUT = TELEGRAM_TIMEOUT
+    apihelper.RETRY_ON_ERROR = True
+    apihelper.MAX_RETRIES = TELEGRAM_MAX_RETRIES
 
 
-def _process_homeworks(bot, timestamp, last_sent_message):
+def _process_homeworks(timestamp, outbox, last_status, breaker):
     """Обрабатывает проверку домашних работ."""
-    response = get_api_answer(timestamp)
-    homeworks = check_response(response)
+    response = breaker.call(get_api_answer, timestamp)
+    try:
+        homeworks = check_response(response)
+        for homework in homeworks:
+            try:
+                _queue_new_status(outbox, homework, last_status)
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                # Некорректная работа не должна мешать отправке остальных
+                error_message = f'Сбой в работе программы: {error}'
+                logging.error(error_message)
+                _enqueue(outbox, error_message)
+    except Exception:
+        # Ответ не обработан: повторный запрос не должен получить 304
+        # и потерять статусы из этого ответа
+        _cache_validators.clear()
+        raise
 
     if not homeworks:
         logging.debug('Нет новых статусов')
-        return response.get('current_date', timestamp), last_sent_message
+    return response.get('current_date', timestamp)
+
 
-    homework = homeworks[0]
+def _queue_new_status(outbox, homework, last_status):
+    """Ставит в очередь статус работы, если он изменился."""
     message = parse_status(homework)
+    # Работу без id различаем по названию, а не по общему ключу None
+    if 'id' in homework:
+        homework_key = homework['id']
+    else:
+        homework_key = homework['homework_name']
+    status = homework['status']
+
+    if last_status.get(homework_key) == status:
+        last_status.move_to_end(homework_key)
+        logging.debug('Статус уже был отправлен: %s', message)
+        return
+
+    _enqueue(outbox, message)
+    last_status[homework_key] = status
+    last_status.move_to_end(homework_key)
+    if len(last_status) > MAX_DEDUP:
+        last_status.popitem(last=False)
+
+
+def _enqueue(outbox, message):
+    """Ставит сообщение в очередь, вытесняя самое старое при переполнении."""
+    if len(outbox) == outbox.maxlen:
+        logging.error(
+            'Очередь сообщений переполнена, сообщение отброшено: "%s"',
+            outbox[0])
+    outbox.append(message)
+
+
+def _flush_outbox(bot, outbox):
+    """Отправляет сообщения из очереди.
+
+    Сообщение удаляется из очереди только после успешной отправки, так что
+    при сбое Telegram оно будет отправлено на следующей итерации, даже если
+    запрос к API на ней не удался.
+    """
+    while outbox:
+        send_message(bot, outbox[0])
+        outbox.popleft()
+
+
+def _deliver_outbox(bot, outbox, last_sent_message):
+    """Отправляет очередь сообщений и сообщает о сбое отправки."""
+    try:
+        _flush_outbox(bot, outbox)
+    except Exception as error:
+        return _handle_error(bot, error, last_sent_message)
+    return last_sent_message
+
+
+def _next_regular_poll(deadline):
+    """Возвращает срок следующего планового запроса к API.
+
+    Срок отсчитывается от предыдущего срока, а не от момента пробуждения,
+    поэтому ни время работы итерации, ни округление паузы до целых секунд
+    не накапливаются. Если итерация затянулась дольше RETRY_PERIOD,
+    пропущенные запросы не навёрстываются: следующий уходит сразу.
+    """
+    return max(deadline + RETRY_PERIOD, time.monotonic())
+
+
+def _seconds_until(deadline):
+    """Возвращает число целых секунд до момента deadline.
+
+    Округление вверх гарантирует, что запрос не уйдёт раньше срока.
+    """
+    return max(0, math.ceil(deadline - time.monotonic()))
 
-    if message != last_sent_message:
-        send_message(bot, message)
-        last_sent_message = message
 
-    return response.get('current_date', timestamp), last_sent_message
+def _get_backoff_delay(attempt):
+    """Вычисляет задержку перед повторным запросом после сбоя API."""
+    # Показатель ограничен: при долгом сбое 2 ** attempt не помещается
+    # во float, а задержка и так упирается в BACKOFF_MAX_DELAY
+    exponent = min(attempt - 1, BACKOFF_MAX_EXPONENT)
+    delay = min(BACKOFF_MAX_DELAY, BACKOFF_BASE * 2 ** exponent)
+    return delay * (1 + random.uniform(0, BACKOFF_JITTER))
 
 
 def _handle_error(bot, error, last_sent_message):
@@ -1,3 +1,4 @@
+import json
 import logging
 import signal
 import re
@@ -91,6 +92,7 @@ class MockResponseGET:
         self.status_code = http_status
         self.reason = ''
         self.text = ''
+        self.headers = {}
         default_data = {
             'homeworks': [],
             'current_date': self.random_timestamp
@@ -98,6 +100,10 @@ class MockResponseGET:
         self.data = data if data is not None else default_data
         logging.warn(MockResponseGET.CALLED_LOG_MSG)
 
+    @property
+    def content(self):
+        return json.dumps(self.data).encode()
+
     def json(self):
         return self.data
 
@@ -825,3 +825,424 @@ class TestHomework:
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             check_utils.check_docstring(homework_module, func)
+
+    def test_backoff_delay_grows_and_is_capped(self, homework_module):
+        for attempt in range(1, 2000):
+            expected = min(
+                homework_module.BACKOFF_MAX_DELAY,
+                homework_module.BACKOFF_BASE * 2 ** min(attempt - 1, 16)
+            )
+            delay = homework_module._get_backoff_delay(attempt)
+            assert (
+                expected
+                <= delay
+                <= expected * (1 + homework_module.BACKOFF_JITTER)
+            ), (
+                'Убедитесь, что задержка после сбоя API растёт '
+                'экспоненциально и ограничена `BACKOFF_MAX_DELAY`.'
+            )
+
+    @pytest.mark.parametrize('retry_after, expected', (
+        ('120', 120),
+        (None, RETRY_PERIOD),
+        ('garbage', RETRY_PERIOD),
+    ))
+    def test_get_api_answer_too_many_requests(
+            self, monkeypatch, current_timestamp, homework_module,
+            retry_after, expected
+    ):
+        def mock_response_get(*args, **kwargs):
+            response = check_utils.MockResponseGET(
+                *args, http_status=HTTPStatus.TOO_MANY_REQUESTS, **kwargs
+            )
+            response.headers = (
+                {} if retry_after is None else {'Retry-After': retry_after}
+            )
+            return response
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        with pytest.raises(homework_module.RateLimitError) as error:
+            homework_module.get_api_answer(current_timestamp)
+        assert error.value.retry_after == expected, (
+            'Убедитесь, что при ответе API с кодом 429 задержка берётся '
+            'из заголовка `Retry-After`.'
+        )
+        assert str(expected) not in str(error.value), (
+            'Убедитесь, что текст ошибки о превышении лимита не зависит '
+            'от задержки, иначе он каждый раз отправляется в Telegram.'
+        )
+
+    def test_get_api_answer_conditional_request(
+            self, monkeypatch, current_timestamp, random_timestamp,
+            homework_module
+    ):
+        monkeypatch.setattr(homework_module, '_cache_validators', {})
+        sent_headers = []
+
+        def mock_response_get(*args, http_status=HTTPStatus.OK, **kwargs):
+            sent_headers.append(kwargs['headers'])
+            response = check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                http_status=http_status, **kwargs
+            )
+            response.headers = {'ETag': '"abc"'}
+            return response
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        homework_module.get_api_answer(current_timestamp)
+        assert 'If-None-Match' not in sent_headers[-1]
+
+        monkeypatch.setattr(
+            requests, 'get',
+            lambda *args, **kwargs: mock_response_get(
+                *args, http_status=HTTPStatus.NOT_MODIFIED, **kwargs
+            )
+        )
+        result = homework_module.get_api_answer(current_timestamp)
+        assert sent_headers[-1].get('If-None-Match') == '"abc"', (
+            'Убедитесь, что в запрос к API передаётся ETag '
+            'предыдущего ответа.'
+        )
+        assert result == {
+            'homeworks': [], 'current_date': current_timestamp
+        }, (
+            'Убедитесь, что ответ API с кодом 304 обрабатывается '
+            'как отсутствие новых статусов.'
+        )
+
+    def test_process_homeworks_skips_already_sent_status(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            homework_module, data_with_new_hw_status
+    ):
+        monkeypatch.setattr(
+            requests, 'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=data_with_new_hw_status
+            )
+        )
+        outbox = homework_module.deque()
+        last_status = homework_module.OrderedDict()
+        breaker = homework_module.CircuitBreaker()
+        for _ in range(2):
+            homework_module._process_homeworks(
+                current_timestamp, outbox, last_status, breaker
+            )
+        sent_messages = list(outbox)
+        assert len(sent_messages) == 1, (
+            'Убедитесь, что бот не отправляет повторно '
+            'уже отправленный статус домашней работы.'
+        )
+
+    def test_get_api_answer_with_timeout(
+            self, current_timestamp, monkeypatch, homework_module
+    ):
+        def mock_request_get_with_timeout(*args, **kwargs):
+            assert kwargs.get('timeout'), (
+                'Убедитесь, что в запрос к API передан параметр `timeout`.'
+            )
+            raise requests.exceptions.ReadTimeout('Read timed out')
+
+        monkeypatch.setattr(requests, 'get', mock_request_get_with_timeout)
+        with pytest.raises(ConnectionError):
+            homework_module.get_api_answer(current_timestamp)
+
+    def test_circuit_breaker(self, homework_module):
+        breaker = homework_module.CircuitBreaker(threshold=2, cooldowns=(60,))
+        calls = []
+
+        def failing_request():
+            calls.append(1)
+            raise ConnectionError('API недоступен')
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(failing_request)
+        with pytest.raises(homework_module.CircuitOpenError):
+            breaker.call(failing_request)
+        assert len(calls) == 2, (
+            'Убедитесь, что после серии сбоев запросы к API '
+            'временно не отправляются.'
+        )
+
+        breaker.opened_at -= breaker.cooldown
+        assert breaker.call(lambda: 'ok') == 'ok'
+        assert breaker.state == breaker.CLOSED, (
+            'Убедитесь, что успешный пробный запрос '
+            'возобновляет запросы к API.'
+        )
+
+    def test_process_homeworks_sends_every_new_status(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            homework_module
+    ):
+        homeworks = [
+            {'id': hw_id, 'homework_name': f'hw{hw_id}', 'status': status}
+            for hw_id, status in enumerate(self.HOMEWORK_VERDICTS)
+        ]
+        monkeypatch.setattr(
+            requests, 'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data={
+                    'homeworks': homeworks,
+                    'current_date': random_timestamp
+                }
+            )
+        )
+        outbox = homework_module.deque()
+        homework_module._process_homeworks(
+            current_timestamp, outbox, homework_module.OrderedDict(),
+            homework_module.CircuitBreaker()
+        )
+        sent_messages = list(outbox)
+        assert len(sent_messages) == len(homeworks), (
+            'Убедитесь, что бот отправляет статусы всех домашних работ '
+            'из ответа API.'
+        )
+
+    def test_flush_outbox_keeps_unsent_messages(
+            self, monkeypatch, homework_module
+    ):
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+
+        class MockedBotWithException(check_utils.MockTelegramBot):
+            def send_message(self, *args, **kwargs):
+                raise telebot.apihelper.ApiException(
+                    'Произошла ошибка при отправке сообщения в Telegram.',
+                    'send_message',
+                    500
+                )
+
+        outbox = homework_module.deque(['first', 'second'])
+        with pytest.raises(telebot.apihelper.ApiException):
+            homework_module._flush_outbox(MockedBotWithException(), outbox)
+        assert list(outbox) == ['first', 'second'], (
+            'Убедитесь, что сообщение, которое не удалось отправить '
+            'в Telegram, остаётся в очереди.'
+        )
+
+        bot = check_utils.MockTelegramBot()
+        homework_module._flush_outbox(bot, outbox)
+        assert not outbox and bot.text == 'second'
+
+    def test_check_tokens_converts_chat_id(self, monkeypatch, homework_module):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        homework_module.check_tokens()
+        assert homework_module.TELEGRAM_CHAT_ID == 12345, (
+            'Убедитесь, что `check_tokens` приводит `TELEGRAM_CHAT_ID` '
+            'к целому числу.'
+        )
+
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', 'chat')
+        with pytest.raises(ValueError):
+            homework_module.check_tokens()
+
+    def test_seconds_until_deadline(self, monkeypatch, homework_module):
+        monkeypatch.setattr(time, 'monotonic', lambda: 1000.5)
+        assert homework_module._seconds_until(1000.5 + 599.2) == 600, (
+            'Убедитесь, что время работы итерации вычитается из паузы '
+            'и следующий запрос не уходит раньше срока.'
+        )
+        assert homework_module._seconds_until(900) == 0
+
+    def test_regular_polls_do_not_drift(self, monkeypatch, homework_module):
+        clock = {'now': 1000.0}
+        monkeypatch.setattr(time, 'monotonic', lambda: clock['now'])
+        deadline = clock['now']
+        for _ in range(5):
+            deadline = homework_module._next_regular_poll(deadline)
+            clock['now'] += 0.7
+            clock['now'] += homework_module._seconds_until(deadline)
+        assert deadline == 1000.0 + 5 * self.RETRY_PERIOD, (
+            'Убедитесь, что срок следующего запроса отсчитывается '
+            'от предыдущего срока и не накапливает сдвиг.'
+        )
+        assert clock['now'] < deadline + 1
+
+        clock['now'] = deadline + 3 * self.RETRY_PERIOD
+        assert homework_module._next_regular_poll(deadline) == clock['now']
+
+    def test_cache_validators_dropped_when_processing_fails(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            homework_module
+    ):
+        monkeypatch.setattr(homework_module, '_cache_validators', {})
+
+        def mock_response_get(*args, **kwargs):
+            response = check_utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                data={
+                    'homeworks': {'homework_name': 'hw123'},
+                    'current_date': random_timestamp
+                },
+                **kwargs
+            )
+            response.headers = {'ETag': '"abc"'}
+            return response
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        with pytest.raises(TypeError):
+            homework_module._process_homeworks(
+                current_timestamp, homework_module.deque(),
+                homework_module.OrderedDict(),
+                homework_module.CircuitBreaker()
+            )
+        assert not homework_module._cache_validators, (
+            'Убедитесь, что при ошибке обработки ответа API ETag не '
+            'сохраняется и повторный запрос не получит ответ 304.'
+        )
+
+    def test_queue_new_status_sends_returning_status(self, homework_module):
+        outbox = homework_module.deque()
+        last_status = homework_module.OrderedDict()
+        statuses = ('reviewing', 'rejected', 'reviewing', 'reviewing',
+                    'approved')
+        for status in statuses:
+            homework_module._queue_new_status(
+                outbox,
+                {'id': 1, 'homework_name': 'hw1', 'status': status},
+                last_status
+            )
+        expected_statuses = ('reviewing', 'rejected', 'reviewing', 'approved')
+        assert len(outbox) == len(expected_statuses) and all(
+            message.endswith(self.HOMEWORK_VERDICTS[status])
+            for message, status in zip(outbox, expected_statuses)
+        ), (
+            'Убедитесь, что бот отправляет статус, вернувшийся после '
+            'другого статуса, и не повторяет статус без изменений.'
+        )
+
+        for name in ('hw2', 'hw3'):
+            homework_module._queue_new_status(
+                outbox,
+                {'homework_name': name, 'status': 'approved'},
+                last_status
+            )
+        assert len(outbox) == 6, (
+            'Убедитесь, что статусы работ без `id` не подавляют друг друга.'
+        )
+
+    def test_main_waits_for_circuit_breaker_cooldown(
+            self, monkeypatch, random_message, homework_module
+    ):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        get_mock_telegram_bot(monkeypatch, random_message)
+
+        circuit_breaker = homework_module.CircuitBreaker
+
+        def open_breaker():
+            breaker = circuit_breaker(cooldowns=(60,))
+            breaker.state = breaker.OPEN
+            breaker.trips = 1
+            breaker.opened_at = time.monotonic()
+            return breaker
+
+        def unexpected_request(*args, **kwargs):
+            raise AssertionError(
+                'Убедитесь, что при разомкнутом автомате запрос к API '
+                'не отправляется.'
+            )
+
+        sleeps = []
+
+        def mock_sleep(secs):
+            sleeps.append(secs)
+            raise check_utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(homework_module, 'CircuitBreaker', open_breaker)
+        monkeypatch.setattr(requests, 'get', unexpected_request)
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(check_utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert sleeps == [60], (
+            'Убедитесь, что при разомкнутом автомате следующий запрос '
+            'к API планируется по окончании паузы автомата.'
+        )
+
+    def test_process_homeworks_continues_after_invalid_homework(
+            self, monkeypatch, random_timestamp, current_timestamp,
+            homework_module
+    ):
+        homeworks = [
+            {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+            {'id': 2, 'homework_name': 'hw2', 'status': 'weird'},
+            {'id': 3, 'homework_name': 'hw3', 'status': 'approved'},
+        ]
+        monkeypatch.setattr(
+            requests, 'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data={
+                    'homeworks': homeworks,
+                    'current_date': random_timestamp
+                }
+            )
+        )
+        outbox = homework_module.deque()
+        timestamp = homework_module._process_homeworks(
+            current_timestamp, outbox, homework_module.OrderedDict(),
+            homework_module.CircuitBreaker()
+        )
+        messages = list(outbox)
+        assert len(messages) == 3 and '"hw3"' in messages[2], (
+            'Убедитесь, что ошибка в одной домашней работе не мешает '
+            'отправить статусы остальных работ из ответа API.'
+        )
+        assert 'weird' in messages[1]
+        assert timestamp == random_timestamp
+
+    def test_main_flushes_outbox_while_api_fails(
+            self, monkeypatch, random_timestamp, homework_module,
+            data_with_new_hw_status
+    ):
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        telegram = {'down': True, 'sent': []}
+
+        class FlakyBot(check_utils.MockTelegramBot):
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                if telegram['down']:
+                    raise telebot.apihelper.ApiException(
+                        'Произошла ошибка при отправке сообщения в Telegram.',
+                        'send_message',
+                        500
+                    )
+                telegram['sent'].append(text)
+
+        def failing_request(*args, **kwargs):
+            raise requests.ConnectionError('API недоступен')
+
+        def mock_sleep(secs):
+            if not telegram['down']:
+                raise check_utils.BreakInfiniteLoop('break')
+            telegram['down'] = False
+            monkeypatch.setattr(requests, 'get', failing_request)
+
+        monkeypatch.setattr(telebot, 'TeleBot', FlakyBot)
+        monkeypatch.setattr(
+            requests, 'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.OK,
+                data=data_with_new_hw_status
+            )
+        )
+        monkeypatch.setattr(time, 'sleep', mock_sleep)
+        with pytest.raises(check_utils.BreakInfiniteLoop):
+            homework_module.main()
+        assert any(
+            self.HOMEWORK_VERDICTS['approved'] in text
+            for text in telegram['sent']
+        ), (
+            'Убедитесь, что статус, который не удалось отправить, '
+            'отправляется повторно, даже если запрос к API не удался.'
+        )